@@ -0,0 +1,72 @@
+"""Benchmark for bulk reminder creation against the one-at-a-time endpoint.
+
+Runs the router functions against an in-process stand-in for SupabaseService
+that charges a fixed round trip per call, so no database is touched.
+
+Run from the backend directory:  python -m benchmarks.bench_bulk_create
+"""
+import asyncio
+import orjson
+import os
+import time as clock
+from datetime import date, time
+
+# services.supabase_service creates its client at import time
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "bench")
+
+from models import ReminderBulkCreate, ReminderSchedule
+from routers.reminders import create_reminder, create_reminders_bulk
+
+ROUND_TRIP_MS = 20 # Typical app server -> Supabase latency
+DOSE_TIMES = [time(8, 0), time(14, 0), time(20, 0)]
+DAYS = 30
+
+class SimulatedSupabaseService:
+    def __init__(self):
+        self.calls = 0
+        self.next_id = 0
+
+    async def _round_trip(self, rows):
+        self.calls += 1
+        await asyncio.sleep(ROUND_TRIP_MS / 1000)
+        created = []
+        for row in rows:
+            self.next_id += 1
+            created.append({**row, "id": str(self.next_id)})
+        return created
+
+    async def create_reminder(self, reminder_data):
+        return (await self._round_trip([reminder_data]))[0]
+
+    async def create_reminders(self, reminders_data):
+        return await self._round_trip(reminders_data)
+
+async def one_at_a_time(schedule: ReminderSchedule, service: SimulatedSupabaseService) -> int:
+    created = 0
+    for reminder in schedule.expand():
+        await create_reminder(reminder, supabase_service=service)
+        created += 1
+    return created
+
+async def bulk(schedule: ReminderSchedule, service: SimulatedSupabaseService) -> int:
+    response = await create_reminders_bulk(ReminderBulkCreate(schedule=schedule), supabase_service=service)
+    return len(orjson.loads(response.body)["created"])
+
+async def main():
+    schedule = ReminderSchedule(
+        user_id="bench-user",
+        message="Take amoxicillin 500mg",
+        times=DOSE_TIMES,
+        start_date=date.today(),
+        days=DAYS
+    )
+    for name, path in (("one at a time", one_at_a_time), ("bulk", bulk)):
+        service = SimulatedSupabaseService()
+        start = clock.perf_counter()
+        created = await path(schedule, service)
+        elapsed = clock.perf_counter() - start
+        print(f"{name:<14} {created} reminders, {service.calls:3d} inserts: {elapsed * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    asyncio.run(main())
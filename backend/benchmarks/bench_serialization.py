@@ -0,0 +1,114 @@
+"""Benchmark for the /chat response path on a long history.
+
+Calls the real route through TestClient, with stand-ins for SupabaseService and
+AIService, next to the previous handler (one Message per row, re-validated by
+FastAPI against response_model). No database or AI provider is touched.
+
+Run from the backend directory:  python -m benchmarks.bench_serialization
+"""
+import os
+import timeit
+from datetime import datetime, timedelta
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+# services.supabase_service creates its client at import time
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "bench")
+
+from models import ChatRequest, ChatResponse, Message
+from routers import chat
+from services.ai_service import AIService
+from services.supabase_service import SupabaseService
+
+HISTORY_SIZE = 10_000
+REPEAT = 5
+
+def make_rows(n: int):
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    return [
+        {
+            "id": i,
+            "user_id": "bench-user",
+            "role": "user" if i % 2 == 0 else "ai",
+            "content": f"Message {i}: how much water should I drink after a workout?",
+            "timestamp": (start + timedelta(seconds=i)).isoformat() + "+00:00",
+            "image_url": None
+        }
+        for i in range(n)
+    ]
+
+class StubSupabaseService:
+    def __init__(self, rows):
+        self.rows = list(rows)
+
+    async def get_chat_history(self, user_id):
+        return self.rows
+
+    async def add_chat_message(self, user_id, role, content, timestamp, image=None):
+        row = {
+            "id": len(self.rows),
+            "user_id": user_id,
+            "role": role,
+            "content": content,
+            "timestamp": timestamp.isoformat(),
+            "image_url": image
+        }
+        self.rows.append(row)
+        return [row]
+
+class StubAIService:
+    async def get_ai_chat_response(self, user_id, message, chat_history):
+        return "Stay hydrated. This is not a substitute for a doctor."
+
+async def legacy_chat_with_ai(
+    request: ChatRequest,
+    supabase_service: SupabaseService = Depends(SupabaseService),
+    ai_service: AIService = Depends(AIService)
+):
+    # chat_with_ai before the fast path, minus the unused *_message_db dicts
+    await supabase_service.add_chat_message(request.user_id, "user", request.message, datetime.now())
+    raw_history = await supabase_service.get_chat_history(request.user_id)
+    chat_history = []
+    for item in raw_history:
+        chat_history.append({
+            "role": item["role"],
+            "content": item["content"],
+            "timestamp": datetime.fromisoformat(item["timestamp"]),
+            "image": item.get("image_url")
+        })
+    ai_reply_content = await ai_service.get_ai_chat_response(request.user_id, request.message, chat_history)
+    await supabase_service.add_chat_message(request.user_id, "ai", ai_reply_content, datetime.now())
+    updated_history = await supabase_service.get_chat_history(request.user_id)
+    formatted_updated_history = []
+    for item in updated_history:
+        formatted_updated_history.append(Message(
+            id=str(item["id"]),
+            role=item["role"],
+            content=item["content"],
+            timestamp=datetime.fromisoformat(item["timestamp"]),
+            image=item.get("image_url")
+        ))
+    return ChatResponse(reply=ai_reply_content, chat_history=formatted_updated_history)
+
+def make_client(rows) -> TestClient:
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/api")
+    app.add_api_route("/legacy/chat", legacy_chat_with_ai, methods=["POST"], response_model=ChatResponse)
+    supabase_service = StubSupabaseService(rows)
+    app.dependency_overrides[SupabaseService] = lambda: supabase_service
+    app.dependency_overrides[AIService] = StubAIService
+    return TestClient(app)
+
+def main():
+    rows = make_rows(HISTORY_SIZE)
+    payload = {"user_id": "bench-user", "message": "How much water should I drink?"}
+    for name, path in (("previous handler", "/legacy/chat"), ("fast path (orjson)", "/api/chat")):
+        client = make_client(rows)
+        response = client.post(path, json=payload)
+        response.raise_for_status()
+        best = min(timeit.repeat(lambda: client.post(path, json=payload), number=1, repeat=REPEAT))
+        print(f"{name:<20} {len(response.json()['chat_history'])} messages: {best * 1000:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
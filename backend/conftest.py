@@ -0,0 +1,5 @@
+import os
+
+# services.supabase_service creates its client at import time
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "test")
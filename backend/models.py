@@ -1,6 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
-from datetime import datetime, date, time
+from datetime import datetime, date, time, timedelta
+
+# Upper bounds for the bulk create endpoints, counted after schedules/series are expanded
+MAX_BULK_APPOINTMENTS = 500
+MAX_BULK_REMINDERS = 1000
 
 class Message(BaseModel):
     id: Optional[str] = None
@@ -50,6 +54,33 @@ class Appointment(AppointmentBase):
     class Config:
         orm_mode = True # For SQLAlchemy compatibility, good practice
 
+class AppointmentSeries(AppointmentCreate):
+    occurrences: int = Field(..., ge=1, le=MAX_BULK_APPOINTMENTS)
+    interval_days: int = Field(7, ge=1, le=365)
+
+    def expand(self) -> List[AppointmentCreate]:
+        # May raise OverflowError if the series runs past date.max
+        appointment_data = self.dict(exclude={"occurrences", "interval_days"})
+        return [
+            AppointmentCreate(**{**appointment_data, "date": self.date + timedelta(days=i * self.interval_days)})
+            for i in range(self.occurrences)
+        ]
+
+class AppointmentBulkCreate(BaseModel):
+    appointments: List[AppointmentCreate] = Field([], max_length=MAX_BULK_APPOINTMENTS)
+    series: Optional[AppointmentSeries] = None # Expanded and appended after `appointments`
+
+    def expanded_count(self) -> int:
+        return len(self.appointments) + (self.series.occurrences if self.series else 0)
+
+class BulkItemError(BaseModel):
+    index: int # Position in the expanded batch
+    detail: str
+
+class AppointmentBulkResponse(BaseModel):
+    created: List[Appointment]
+    errors: List[BulkItemError]
+
 class ReminderBase(BaseModel):
     user_id: str
     message: str
@@ -67,6 +98,32 @@ class Reminder(ReminderBase):
     class Config:
         orm_mode = True
 
+class ReminderSchedule(BaseModel):
+    user_id: str
+    message: str
+    times: List[time] = Field(..., min_length=1, max_length=MAX_BULK_REMINDERS) # Dose times for each day, e.g. 08:00, 14:00, 20:00
+    start_date: date
+    days: int = Field(..., ge=1, le=MAX_BULK_REMINDERS)
+
+    def expand(self) -> List[ReminderCreate]:
+        # May raise OverflowError if the schedule runs past date.max
+        reminder_data = self.dict(exclude={"times", "start_date", "days"})
+        return [
+            ReminderCreate(**{**reminder_data, "time": t, "reminder_date": self.start_date + timedelta(days=day)})
+            for day in range(self.days)
+            for t in self.times
+        ]
+
+class ReminderBulkCreate(BaseModel):
+    reminders: List[ReminderCreate] = Field([], max_length=MAX_BULK_REMINDERS)
+    schedule: Optional[ReminderSchedule] = None # Expanded and appended after `reminders`
+
+    def expanded_count(self) -> int:
+        return len(self.reminders) + (len(self.schedule.times) * self.schedule.days if self.schedule else 0)
+
+class ReminderBulkResponse(BaseModel):
+    created: List[Reminder]
+
 class Doctor(BaseModel):
     id: str
     name: str
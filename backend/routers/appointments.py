@@ -1,12 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
-from models import Appointment, AppointmentCreate
+from models import Appointment, AppointmentCreate, AppointmentBulkCreate, AppointmentBulkResponse, MAX_BULK_APPOINTMENTS
 from services.supabase_service import SupabaseService
 from services.ai_service import AIService
+from serialization import FastJSONResponse, project_rows
 from datetime import datetime, date, time
 
 router = APIRouter()
 
+def _appointment_row(appointment: AppointmentCreate) -> dict:
+    appointment_data = appointment.dict()
+    appointment_data['status'] = "pending"
+    appointment_data['created_at'] = datetime.now().isoformat()
+    # Supabase expects date/time as strings for simple types, or proper datetime objects for timestamp fields
+    appointment_data['date'] = appointment_data['date'].isoformat()
+    appointment_data['time'] = appointment_data['time'].isoformat()
+    return appointment_data
+
 @router.post("/appointments", response_model=Appointment)
 async def create_appointment(
     appointment: AppointmentCreate,
@@ -25,12 +35,7 @@ async def create_appointment(
         else:
             raise HTTPException(status_code=404, detail=f"No doctors found for specialization: {appointment.specialization}")
 
-    appointment_data = appointment.dict()
-    appointment_data['status'] = "pending"
-    appointment_data['created_at'] = datetime.now().isoformat()
-    # Supabase expects date/time as strings for simple types, or proper datetime objects for timestamp fields
-    appointment_data['date'] = appointment_data['date'].isoformat()
-    appointment_data['time'] = appointment_data['time'].isoformat()
+    appointment_data = _appointment_row(appointment)
 
     try:
         new_appointment = await supabase_service.create_appointment(appointment_data)
@@ -40,12 +45,66 @@ async def create_appointment(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating appointment: {e}")
 
+@router.post("/appointments/bulk", response_model=AppointmentBulkResponse)
+async def create_appointments_bulk(
+    batch: AppointmentBulkCreate,
+    supabase_service: SupabaseService = Depends(SupabaseService)
+):
+    """Create a batch of appointments (and an optional recurring series) with one insert.
+
+    Items that can't be prepared are skipped and reported in `errors` by their
+    index in the expanded batch; the rest are inserted together and returned in
+    `created`. If the insert itself fails, nothing is created and a 500 is raised.
+    """
+    # Check the size before expanding so a huge series is rejected cheaply
+    count = batch.expanded_count()
+    if not count:
+        raise HTTPException(status_code=400, detail="No appointments to create.")
+    if count > MAX_BULK_APPOINTMENTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_APPOINTMENTS} appointments can be created per request.")
+
+    appointments = list(batch.appointments)
+    if batch.series:
+        try:
+            appointments.extend(batch.series.expand())
+        except OverflowError:
+            raise HTTPException(status_code=400, detail="Appointment series runs past the latest supported date.")
+
+    errors = []
+    rows = []
+    doctors_by_specialization = {}
+    for index, appointment in enumerate(appointments):
+        if appointment.specialization and not appointment.doctor_id:
+            # Look each specialization up once per batch rather than once per item
+            if appointment.specialization not in doctors_by_specialization:
+                doctors_by_specialization[appointment.specialization] = await supabase_service.get_doctors(specialization=appointment.specialization)
+            doctors = doctors_by_specialization[appointment.specialization]
+            if not doctors:
+                errors.append({"index": index, "detail": f"No doctors found for specialization: {appointment.specialization}"})
+                continue
+            appointment.doctor_id = doctors[0]['id']
+        rows.append(_appointment_row(appointment))
+
+    created = []
+    if rows:
+        try:
+            created = await supabase_service.create_appointments(rows)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error creating appointments: {e}")
+        if not created:
+            raise HTTPException(status_code=500, detail="Failed to create appointments in Supabase.")
+
+    return FastJSONResponse({
+        "created": project_rows(created, Appointment),
+        "errors": errors
+    })
+
 @router.get("/appointments/{user_id}", response_model=List[Appointment])
 async def get_user_appointments(
     user_id: str,
     supabase_service: SupabaseService = Depends(SupabaseService)
 ):
     appointments = await supabase_service.get_appointments(user_id)
-    return [Appointment(**app) for app in appointments]
+    return FastJSONResponse(project_rows(appointments, Appointment))
 
 # Example: Could add a PUT/DELETE for updating/cancelling appointments
\ No newline at end of file
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
 from datetime import datetime
 from models import ChatRequest, ChatResponse, Message
+from serialization import FastJSONResponse, format_chat_history
 from services.supabase_service import SupabaseService
 from services.ai_service import AIService
 
@@ -27,14 +28,7 @@ async def chat_with_ai(
 
     # 2. Get full chat history for context
     raw_history = await supabase_service.get_chat_history(user_id)
-    chat_history = []
-    for item in raw_history:
-        chat_history.append({
-            "role": item["role"],
-            "content": item["content"],
-            "timestamp": datetime.fromisoformat(item["timestamp"]),
-            "image": item.get("image_url")
-        })
+    chat_history = format_chat_history(raw_history)
 
     # 3. Get AI response
     ai_reply_content = await ai_service.get_ai_chat_response(user_id, user_message_content, chat_history)
@@ -46,18 +40,15 @@ async def chat_with_ai(
         "content": ai_reply_content,
         "timestamp": datetime.now().isoformat()
     }
-    await supabase_service.add_chat_message(user_id, "ai", ai_reply_content, datetime.now())
+    ai_rows = await supabase_service.add_chat_message(user_id, "ai", ai_reply_content, datetime.now())
 
     # 5. Return updated chat history and AI reply
-    updated_history = await supabase_service.get_chat_history(user_id)
-    formatted_updated_history = []
-    for item in updated_history:
-         formatted_updated_history.append(Message(
-            id=str(item["id"]),
-            role=item["role"],
-            content=item["content"],
-            timestamp=datetime.fromisoformat(item["timestamp"]),
-            image=item.get("image_url")
-        ))
-
-    return ChatResponse(reply=ai_reply_content, chat_history=formatted_updated_history)
\ No newline at end of file
+    # The inserted AI row is appended to the history we already have instead of
+    # re-fetching it; the response is returned directly so FastAPI doesn't
+    # re-validate every Message against response_model.
+    if ai_rows:
+        chat_history.extend(format_chat_history(ai_rows))
+    else:
+        chat_history = format_chat_history(await supabase_service.get_chat_history(user_id))
+
+    return FastJSONResponse({"reply": ai_reply_content, "chat_history": chat_history})
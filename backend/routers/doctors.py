@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, Query, HTTPException, status
 from typing import List, Optional
 from models import Doctor
 from services.supabase_service import SupabaseService
+from serialization import FastJSONResponse, project_rows
 
 router = APIRouter()
 
@@ -11,7 +12,7 @@ async def get_doctors(
     supabase_service: SupabaseService = Depends(SupabaseService)
 ):
     doctors = await supabase_service.get_doctors(specialization=specialization)
-    return [Doctor(**doc) for doc in doctors]
+    return FastJSONResponse(project_rows(doctors, Doctor))
 
 @router.get("/doctors/{doctor_id}", response_model=Doctor)
 async def get_doctor_by_id(
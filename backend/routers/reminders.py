@@ -1,22 +1,27 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
-from models import Reminder, ReminderCreate
+from models import Reminder, ReminderCreate, ReminderBulkCreate, ReminderBulkResponse, MAX_BULK_REMINDERS
 from services.supabase_service import SupabaseService
+from serialization import FastJSONResponse, project_rows
 from datetime import datetime, date, time
 
 router = APIRouter()
 
+def _reminder_row(reminder: ReminderCreate) -> dict:
+    reminder_data = reminder.dict()
+    reminder_data['status'] = "active"
+    reminder_data['created_at'] = datetime.now().isoformat()
+    reminder_data['time'] = reminder_data['time'].isoformat()
+    if reminder_data.get('reminder_date'):
+        reminder_data['reminder_date'] = reminder_data['reminder_date'].isoformat()
+    return reminder_data
+
 @router.post("/reminders", response_model=Reminder)
 async def create_reminder(
     reminder: ReminderCreate,
     supabase_service: SupabaseService = Depends(SupabaseService)
 ):
-    reminder_data = reminder.dict()
-    reminder_data['status'] = "active"
-    reminder_data['created_at'] = datetime.now().isoformat()
-    reminder_data['time'] = reminder_data['time'].isoformat()
-    if reminder_data.get('date'):
-        reminder_data['date'] = reminder_data['date'].isoformat()
+    reminder_data = _reminder_row(reminder)
 
     try:
         new_reminder = await supabase_service.create_reminder(reminder_data)
@@ -26,21 +31,48 @@ async def create_reminder(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating reminder: {e}")
 
+@router.post("/reminders/bulk", response_model=ReminderBulkResponse)
+async def create_reminders_bulk(
+    batch: ReminderBulkCreate,
+    supabase_service: SupabaseService = Depends(SupabaseService)
+):
+    """Create a batch of reminders (and an optional daily dose schedule) with one insert.
+
+    Unlike appointments, reminder batches are all-or-nothing and have no
+    `errors` list: invalid items fail validation (422) and a failed insert
+    raises a 500, so either every reminder is returned in `created` or none is.
+    """
+    # Check the size before expanding so a huge schedule is rejected cheaply
+    count = batch.expanded_count()
+    if not count:
+        raise HTTPException(status_code=400, detail="No reminders to create.")
+    if count > MAX_BULK_REMINDERS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_REMINDERS} reminders can be created per request.")
+
+    reminders = list(batch.reminders)
+    if batch.schedule:
+        try:
+            reminders.extend(batch.schedule.expand())
+        except OverflowError:
+            raise HTTPException(status_code=400, detail="Reminder schedule runs past the latest supported date.")
+
+    try:
+        created = await supabase_service.create_reminders([_reminder_row(reminder) for reminder in reminders])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error creating reminders: {e}")
+    if not created:
+        raise HTTPException(status_code=500, detail="Failed to create reminders in Supabase.")
+
+    return FastJSONResponse({"created": project_rows(created, Reminder)})
+
 @router.get("/reminders/{user_id}", response_model=List[Reminder])
 async def get_user_reminders(
     user_id: str,
     supabase_service: SupabaseService = Depends(SupabaseService)
 ):
     reminders = await supabase_service.get_reminders(user_id)
-    # Ensure date/time objects are correctly handled if they are not stored as ISO strings
-    # Supabase client usually handles this if you pass datetime objects to insert,
-    # but when retrieving, you might need to convert back from string if not directly read as object.
-    formatted_reminders = []
-    for r in reminders:
-        r['time'] = time.fromisoformat(r['time'])
-        if r.get('date'):
-            r['date'] = date.fromisoformat(r['date'])
-        formatted_reminders.append(Reminder(**r))
-    return formatted_reminders
+    # Supabase returns date/time columns as ISO strings, which is already their
+    # JSON form, so rows are passed through without per-row fromisoformat calls.
+    return FastJSONResponse(project_rows(reminders, Reminder))
 
 # CRUD operations for reminders can be expanded here (update, delete)
\ No newline at end of file
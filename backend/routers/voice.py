@@ -3,6 +3,7 @@ from typing import Optional
 from models import VoiceResponse, Message
 from services.ai_service import AIService
 from services.supabase_service import SupabaseService
+from serialization import format_chat_history
 from datetime import datetime
 from starlette.responses import StreamingResponse
 import io
@@ -28,14 +29,7 @@ async def voice_input_handler(
 
     # 3. Get chat history for context
     raw_history = await supabase_service.get_chat_history(user_id)
-    chat_history = []
-    for item in raw_history:
-        chat_history.append({
-            "role": item["role"],
-            "content": item["content"],
-            "timestamp": datetime.fromisoformat(item["timestamp"]),
-            "image": item.get("image_url")
-        })
+    chat_history = format_chat_history(raw_history)
 
     # 4. Get AI response based on transcribed text and history
     ai_reply_content = await ai_service.get_ai_chat_response(user_id, transcribed_text, chat_history)
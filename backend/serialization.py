@@ -0,0 +1,54 @@
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from typing import List, Dict, Any, Iterable, Type
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (native datetime/date/time support)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+def _field_defaults(model: Type[BaseModel]) -> Dict[str, Any]:
+    # Required fields have no default and are emitted as None when the column is NULL/missing
+    return {
+        name: None if field.is_required() else field.get_default(call_default_factory=True)
+        for name, field in model.model_fields.items()
+    }
+
+def project_rows(rows: Iterable[Dict[str, Any]], model: Type[BaseModel]) -> List[Dict[str, Any]]:
+    """Shape Supabase rows to a response model's fields without building model instances.
+
+    Rows come back from Supabase already typed by the table schema, with
+    date/time/timestamp columns as ISO strings, so they are passed through
+    as-is instead of being parsed and re-serialized per row. `id` is coerced
+    to str, extra columns are dropped and NULL/missing columns take the
+    model's field default.
+
+    Unlike response_model serialization, timestamps keep PostgREST's format
+    (e.g. `+00:00` rather than `Z`, fractional seconds not padded to 6 digits).
+    """
+    defaults = _field_defaults(model)
+    projected = []
+    for row in rows:
+        item = {}
+        for name, default in defaults.items():
+            value = row.get(name)
+            item[name] = default if value is None else value
+        if item.get("id") is not None:
+            item["id"] = str(item["id"])
+        projected.append(item)
+    return projected
+
+def format_chat_history(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Shape chat_history rows like models.Message, keeping timestamps as PostgREST's ISO strings."""
+    return [
+        {
+            "id": str(item["id"]),
+            "role": item["role"],
+            "content": item["content"],
+            "timestamp": item["timestamp"],
+            "image": item.get("image_url")
+        }
+        for item in rows
+    ]
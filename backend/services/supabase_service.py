@@ -38,6 +38,11 @@ class SupabaseService:
         response = self.supabase.from_('appointments').insert(appointment_data).execute()
         return response.data[0] if response.data else None
 
+    async def create_appointments(self, appointments_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Single multi-row insert; PostgREST applies it as one statement, so it succeeds or fails as a whole
+        response = self.supabase.from_('appointments').insert(appointments_data).execute()
+        return response.data or []
+
     async def get_reminders(self, user_id: str) -> List[Dict[str, Any]]:
         # Fetch reminders for today and future
         today = date.today().isoformat()
@@ -48,6 +53,10 @@ class SupabaseService:
         response = self.supabase.from_('reminders').insert(reminder_data).execute()
         return response.data[0] if response.data else None
 
+    async def create_reminders(self, reminders_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        response = self.supabase.from_('reminders').insert(reminders_data).execute()
+        return response.data or []
+
     async def get_doctors(self, specialization: Optional[str] = None) -> List[Dict[str, Any]]:
         query = self.supabase.from_('doctors').select('*')
         if specialization:
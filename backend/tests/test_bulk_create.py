@@ -0,0 +1,146 @@
+import asyncio
+import orjson
+import pytest
+from datetime import date, time, timedelta
+from fastapi import HTTPException
+from pydantic import ValidationError
+from models import AppointmentBulkCreate, AppointmentSeries, ReminderBulkCreate, ReminderCreate, ReminderSchedule, MAX_BULK_REMINDERS
+from routers.appointments import create_appointments_bulk
+from routers.reminders import _reminder_row, create_reminder, create_reminders_bulk
+
+class StubSupabaseService:
+    def __init__(self, doctors=None, fail_insert=False):
+        self.doctors = doctors or {}
+        self.fail_insert = fail_insert
+        self.doctor_lookups = []
+        self.inserted = []
+
+    async def get_doctors(self, specialization=None):
+        self.doctor_lookups.append(specialization)
+        return self.doctors.get(specialization, [])
+
+    async def _insert(self, rows):
+        if self.fail_insert:
+            raise RuntimeError("insert failed")
+        self.inserted.append(rows)
+        return [{**row, "id": i} for i, row in enumerate(rows)]
+
+    async def create_appointments(self, appointments_data):
+        return await self._insert(appointments_data)
+
+    async def create_reminders(self, reminders_data):
+        return await self._insert(reminders_data)
+
+def run(coro):
+    return orjson.loads(asyncio.run(coro).body)
+
+def test_reminder_schedule_expands_day_by_day_in_time_order():
+    schedule = ReminderSchedule(
+        user_id="u", message="Take medicine", times=[time(8), time(20)], start_date=date(2025, 3, 30), days=3
+    )
+    reminders = schedule.expand()
+    assert [(r.reminder_date, r.time) for r in reminders] == [
+        (date(2025, 3, 30), time(8)), (date(2025, 3, 30), time(20)),
+        (date(2025, 3, 31), time(8)), (date(2025, 3, 31), time(20)),
+        (date(2025, 4, 1), time(8)), (date(2025, 4, 1), time(20)),
+    ]
+    assert ReminderBulkCreate(schedule=schedule).expanded_count() == len(reminders)
+
+def test_appointment_series_expands_at_interval_and_keeps_fields():
+    series = AppointmentSeries(
+        user_id="u", doctor_id="d1", date=date(2025, 1, 1), time=time(9, 30), reason="Physio", occurrences=3, interval_days=14
+    )
+    appointments = series.expand()
+    assert [a.date for a in appointments] == [date(2025, 1, 1), date(2025, 1, 15), date(2025, 1, 29)]
+    assert all(a.doctor_id == "d1" and a.time == time(9, 30) and a.reason == "Physio" for a in appointments)
+
+def test_schedule_bounds_are_validated():
+    with pytest.raises(ValidationError):
+        ReminderSchedule(user_id="u", message="m", times=[], start_date=date(2025, 1, 1), days=1)
+    with pytest.raises(ValidationError):
+        ReminderSchedule(user_id="u", message="m", times=[time(8)], start_date=date(2025, 1, 1), days=MAX_BULK_REMINDERS + 1)
+
+def test_reminders_bulk_inserts_once_and_returns_created_rows():
+    service = StubSupabaseService()
+    batch = ReminderBulkCreate(
+        reminders=[{"user_id": "u", "message": "Checkup", "time": "10:00"}],
+        schedule={"user_id": "u", "message": "Dose", "times": ["08:00", "20:00"], "start_date": "2025-01-01", "days": 2},
+    )
+    body = run(create_reminders_bulk(batch, supabase_service=service))
+    assert len(service.inserted) == 1
+    assert [r["reminder_date"] for r in body["created"]] == [None, "2025-01-01", "2025-01-01", "2025-01-02", "2025-01-02"]
+    assert all(isinstance(r["id"], str) and r["status"] == "active" for r in body["created"])
+
+def test_reminders_bulk_rejects_oversized_schedule_before_expanding():
+    batch = ReminderBulkCreate(
+        schedule={"user_id": "u", "message": "m", "times": ["08:00", "14:00", "20:00"], "start_date": "2025-01-01", "days": MAX_BULK_REMINDERS}
+    )
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(create_reminders_bulk(batch, supabase_service=StubSupabaseService()))
+    assert exc.value.status_code == 400
+
+def test_reminders_bulk_date_overflow_is_a_client_error():
+    batch = ReminderBulkCreate(
+        schedule={"user_id": "u", "message": "m", "times": ["08:00"], "start_date": date.max - timedelta(days=5), "days": 60}
+    )
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(create_reminders_bulk(batch, supabase_service=StubSupabaseService()))
+    assert exc.value.status_code == 400
+
+def test_reminders_bulk_insert_failure_raises():
+    batch = ReminderBulkCreate(reminders=[{"user_id": "u", "message": "m", "time": "08:00"}])
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(create_reminders_bulk(batch, supabase_service=StubSupabaseService(fail_insert=True)))
+    assert exc.value.status_code == 500
+
+def test_appointments_bulk_reports_skipped_items_by_expanded_index():
+    service = StubSupabaseService(doctors={"cardiology": [{"id": "d1"}]})
+    batch = AppointmentBulkCreate(
+        appointments=[
+            {"user_id": "u", "specialization": "cardiology", "date": "2025-01-01", "time": "09:00"},
+            {"user_id": "u", "doctor_id": "d2", "date": "2025-01-02", "time": "09:00"},
+        ],
+        series={"user_id": "u", "specialization": "dermatology", "date": "2025-02-01", "time": "10:00", "occurrences": 2},
+    )
+    body = run(create_appointments_bulk(batch, supabase_service=service))
+    assert [a["doctor_id"] for a in body["created"]] == ["d1", "d2"]
+    assert body["errors"] == [
+        {"index": 2, "detail": "No doctors found for specialization: dermatology"},
+        {"index": 3, "detail": "No doctors found for specialization: dermatology"},
+    ]
+    # One lookup per distinct specialization, not per item
+    assert service.doctor_lookups == ["cardiology", "dermatology"]
+
+def test_appointments_bulk_series_overflow_is_a_client_error():
+    batch = AppointmentBulkCreate(
+        series={"user_id": "u", "doctor_id": "d1", "date": "9999-01-01", "time": "10:00", "occurrences": 400, "interval_days": 365}
+    )
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(create_appointments_bulk(batch, supabase_service=StubSupabaseService()))
+    assert exc.value.status_code == 400
+
+def test_appointments_bulk_insert_failure_raises():
+    batch = AppointmentBulkCreate(appointments=[{"user_id": "u", "doctor_id": "d1", "date": "2025-01-01", "time": "09:00"}])
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(create_appointments_bulk(batch, supabase_service=StubSupabaseService(fail_insert=True)))
+    assert exc.value.status_code == 500
+
+class StubSingleReminderService:
+    def __init__(self):
+        self.inserted = None
+
+    async def create_reminder(self, reminder_data):
+        self.inserted = reminder_data
+        return {**reminder_data, "id": "r1"}
+
+def test_reminder_row_sends_reminder_date_as_iso_string():
+    row = _reminder_row(ReminderCreate(user_id="u", message="m", time=time(8), reminder_date=date(2025, 1, 2)))
+    assert row["reminder_date"] == "2025-01-02"
+    assert row["time"] == "08:00:00"
+
+def test_create_reminder_sends_reminder_date_as_iso_string():
+    service = StubSingleReminderService()
+    reminder = ReminderCreate(user_id="u", message="m", time=time(8), reminder_date=date(2025, 1, 2))
+    created = asyncio.run(create_reminder(reminder, supabase_service=service))
+    assert service.inserted["reminder_date"] == "2025-01-02"
+    assert created.reminder_date == date(2025, 1, 2)
@@ -0,0 +1,54 @@
+import asyncio
+import orjson
+from models import ChatRequest
+from routers.chat import chat_with_ai
+
+class StubSupabaseService:
+    def __init__(self, return_inserted=True):
+        self.return_inserted = return_inserted
+        self.rows = []
+        self.history_fetches = 0
+
+    async def get_chat_history(self, user_id):
+        self.history_fetches += 1
+        return list(self.rows)
+
+    async def add_chat_message(self, user_id, role, content, timestamp, image=None):
+        row = {
+            "id": len(self.rows) + 1,
+            "user_id": user_id,
+            "role": role,
+            "content": content,
+            "timestamp": timestamp.isoformat(),
+            "image_url": image
+        }
+        self.rows.append(row)
+        return [row] if self.return_inserted else []
+
+class StubAIService:
+    def __init__(self):
+        self.seen_history = None
+
+    async def get_ai_chat_response(self, user_id, message, chat_history):
+        self.seen_history = [item["content"] for item in chat_history]
+        return "Drink water. This is not a substitute for a doctor."
+
+def run_chat(supabase_service, ai_service):
+    request = ChatRequest(user_id="u", message="How much water?")
+    response = asyncio.run(chat_with_ai(request, supabase_service=supabase_service, ai_service=ai_service))
+    return orjson.loads(response.body)
+
+def test_chat_appends_inserted_ai_row_without_refetching():
+    supabase_service = StubSupabaseService()
+    ai_service = StubAIService()
+    body = run_chat(supabase_service, ai_service)
+    assert supabase_service.history_fetches == 1
+    assert ai_service.seen_history == ["How much water?"]
+    assert body["reply"] == "Drink water. This is not a substitute for a doctor."
+    assert [(m["id"], m["role"]) for m in body["chat_history"]] == [("1", "user"), ("2", "ai")]
+
+def test_chat_refetches_history_when_insert_returns_nothing():
+    supabase_service = StubSupabaseService(return_inserted=False)
+    body = run_chat(supabase_service, StubAIService())
+    assert supabase_service.history_fetches == 2
+    assert [(m["id"], m["role"]) for m in body["chat_history"]] == [("1", "user"), ("2", "ai")]
@@ -0,0 +1,37 @@
+from models import Appointment, Reminder
+from serialization import format_chat_history, project_rows
+
+def test_project_rows_matches_model_fields_and_defaults():
+    rows = [{
+        "id": 7,
+        "user_id": "u",
+        "message": "Take medicine",
+        "time": "08:00:00",
+        "status": None,
+        "created_at": "2025-01-01T09:00:00+00:00",
+        "extra_column": "dropped"
+    }]
+    assert project_rows(rows, Reminder) == [{
+        "user_id": "u",
+        "message": "Take medicine",
+        "time": "08:00:00",
+        "reminder_date": None,
+        "id": "7",
+        "status": "active",
+        "created_at": "2025-01-01T09:00:00+00:00"
+    }]
+
+def test_project_rows_takes_defaults_from_each_model():
+    row = {"id": "a1", "user_id": "u", "date": "2025-01-01", "time": "09:00:00", "created_at": "2025-01-01T09:00:00+00:00"}
+    assert project_rows([row], Appointment)[0]["status"] == "pending"
+    assert project_rows([], Appointment) == []
+
+def test_format_chat_history_maps_rows_to_message_keys():
+    rows = [
+        {"id": 1, "user_id": "u", "role": "user", "content": "Hi", "timestamp": "2025-01-01T09:00:00+00:00", "image_url": "https://x/img.jpg"},
+        {"id": 2, "user_id": "u", "role": "ai", "content": "Hello", "timestamp": "2025-01-01T09:00:01+00:00"},
+    ]
+    assert format_chat_history(rows) == [
+        {"id": "1", "role": "user", "content": "Hi", "timestamp": "2025-01-01T09:00:00+00:00", "image": "https://x/img.jpg"},
+        {"id": "2", "role": "ai", "content": "Hello", "timestamp": "2025-01-01T09:00:01+00:00", "image": None},
+    ]